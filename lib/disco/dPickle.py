@@ -17,22 +17,28 @@ def unfunc(packed, globals={'__builtins__': __builtins__}):
     code, defs = marshal.loads(packed)
     return types.FunctionType(code, globals, argdefs=defs)
 
-def unpartial(packed):
-    func, args, kwds = loads(packed)
+def unpartial(func, args, kwds):
     return functools.partial(func, *args, **kwds)
 
 class Pickler(pickle.Pickler):
     dispatch = pickle.Pickler.dispatch.copy()
 
+    def __init__(self, *args, **kwargs):
+        pickle.Pickler.__init__(self, *args, **kwargs)
+        self.packed = {}
+
     def save_func(self, func):
         if is_std(getmodule(func)) or func.__module__.startswith('disco.'):
             self.save_global(func)
         else:
-            packed = marshal.dumps((func.func_code, func.func_defaults))
-            self.save_reduce(unfunc, (packed,), obj=func)
+            key = id(func.func_code), id(func.func_defaults)
+            if key not in self.packed:
+                self.packed[key] = marshal.dumps((func.func_code, func.func_defaults))
+            self.save_reduce(unfunc, (self.packed[key],), obj=func)
     dispatch[types.FunctionType] = save_func
 
     def save_partial(self, partial):
-        packed = dumps((partial.func, partial.args, partial.keywords or {}))
-        self.save_reduce(unpartial, (packed,), obj=partial)
+        self.save_reduce(unpartial,
+                         (partial.func, partial.args, partial.keywords or {}),
+                         obj=partial)
     dispatch[functools.partial] = save_partial
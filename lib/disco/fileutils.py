@@ -130,9 +130,12 @@ class DiscoOutput(DiscoOutputStream_v1):
         self.stream.close()
 
 class DiscoZipFile(ZipFile, object):
-    def __init__(self):
+    def __init__(self, contents=''):
         self.buffer = StringIO()
-        super(DiscoZipFile, self).__init__(self.buffer, 'w', ZIP_DEFLATED)
+        self.buffer.write(contents)
+        super(DiscoZipFile, self).__init__(self.buffer,
+                                           'a' if contents else 'w',
+                                           ZIP_DEFLATED)
 
     def writepath(self, pathname, exclude=()):
         for file in files(pathname):
@@ -20,6 +20,7 @@ This can be accomplished using the :meth:`Job.wait` method::
         results = Job(name).run(**jobargs).wait()
 """
 import os, sys, time
+from functools import partial
 
 from disco import func, json, task, util
 from disco.error import JobError
@@ -55,18 +56,18 @@ class Job(object):
                 :attr:`Worker` is called with no arguments to construct the :attr:`worker`.
     """
     from disco.worker.classic.worker import Worker
-    proxy_functions = ('clean',
-                       'events',
-                       'kill',
-                       'jobinfo',
-                       'jobpack',
-                       'oob_get',
-                       'oob_list',
-                       'profile_stats',
-                       'purge',
-                       'results',
-                       'mapresults',
-                       'wait')
+    proxy_functions = frozenset(('clean',
+                                 'events',
+                                 'kill',
+                                 'jobinfo',
+                                 'jobpack',
+                                 'oob_get',
+                                 'oob_list',
+                                 'profile_stats',
+                                 'purge',
+                                 'results',
+                                 'mapresults',
+                                 'wait'))
     """
     These methods from :class:`disco.core.Disco`,
     which take a jobname as the first argument,
@@ -98,7 +99,6 @@ class Job(object):
 
     def __getattr__(self, attr):
         if attr in self.proxy_functions:
-            from functools import partial
             return partial(getattr(self.disco, attr), self.name)
         raise AttributeError("%r has no attribute %r" % (self, attr))
 
@@ -230,7 +230,7 @@ class JobPack(object):
         and prepends a valid header.
         """
         offsets, fields = zip(*self.contents())
-        return self.header(offsets) + ''.join(fields)
+        return ''.join((self.header(offsets), ) + fields)
 
     @classmethod
     def offsets(cls, jobfile, magic=MAGIC, format=HEADER_FORMAT, size=HEADER_SIZE):
@@ -21,6 +21,8 @@ from disco.error import DiscoError, DataError, CommError
 from disco.settings import DiscoSettings
 
 class netloc(tuple):
+    __slots__ = ()
+
     @classmethod
     def parse(cls, netlocstr):
         netlocstr = netlocstr.split('@', 1)[1] if '@' in netlocstr else netlocstr
@@ -43,7 +45,7 @@ class netloc(tuple):
         return '%s:%s' % (host, port) if port else host
 
 def chainify(iterable):
-    return list(chain(*iterable))
+    return list(chain.from_iterable(iterable))
 
 def dsorted(iterable, buffer_size=1e6, tempdir='.'):
     from cPickle import dump, load
@@ -163,14 +165,14 @@ def localize(path, ddfs_data=None, disco_data=None):
         return os.path.join(ddfs_data, fname)
     return os.path.join(disco_data, fname)
 
-def urlsplit(url, localhost=None, disco_port=None, **kwargs):
+def urlsplit(url, localhost=None, disco_port=None, settings=DiscoSettings(), **kwargs):
     scheme, rest = schemesplit(url)
     locstr, path = rest.split('/', 1)  if '/' in rest else (rest ,'')
     if scheme == 'tag':
         if not path:
             path, locstr = locstr, ''
     else:
-        disco_port = disco_port or str(DiscoSettings()['DISCO_PORT'])
+        disco_port = disco_port or str(settings['DISCO_PORT'])
         host, port = netloc.parse(locstr)
         if scheme == 'disco' or port == disco_port:
             if localhost == True or locstr == localhost:
@@ -182,10 +184,10 @@ def urlsplit(url, localhost=None, disco_port=None, **kwargs):
                 locstr = '%s:%s' % (host, disco_port)
     return scheme, netloc.parse(locstr), path
 
-def urlresolve(url, master=None):
+def urlresolve(url, master=None, settings=DiscoSettings()):
     def _master((host, port)):
         if not host:
-            return master or DiscoSettings()['DISCO_MASTER']
+            return master or settings['DISCO_MASTER']
         if not port:
             return 'disco://%s' % host
         return 'http://%s:%s' % (host, port)
@@ -284,31 +286,47 @@ def proxy_url(url, proxy=DiscoSettings()['DISCO_PROXY'], meth='GET', to_master=T
         return '%s/proxy/%s/%s/%s' % (proxy, host, meth, path)
     return url
 
-def read_index(dir):
+def open_index(dir):
     from disco.comm import open_url
     file = open_url(proxy_url(dir, to_master=False))
     if dir.endswith(".gz"):
         file = gzip.GzipFile(fileobj=file)
-    for line in file:
+    return file
+
+def read_index(dir):
+    for line in open_index(dir):
         yield line.split()
 
+def read_index_ids(dir):
+    for line in open_index(dir):
+        yield int(line.split(None, 1)[0])
+
 def ispartitioned(input):
     if isiterable(input):
         return all(ispartitioned(i) for i in input) and len(input)
     return input.startswith('dir://')
 
-def inputexpand(input, partition=None, settings=DiscoSettings()):
+def inputexpand(input, partition=None, settings=DiscoSettings(), tagcache=None):
     from disco.ddfs import DDFS, istag
     if ispartitioned(input) and partition is not False:
         return zip(*(parse_dir(i, partition=partition) for i in iterify(input)))
     if isiterable(input):
-        return [inputlist(input, partition=partition, settings=settings)]
+        return [inputlist(input,
+                          partition=partition,
+                          settings=settings,
+                          tagcache=tagcache)]
     if istag(input):
+        if tagcache and input in tagcache:
+            return tagcache[input]
         ddfs = DDFS(settings=settings)
-        return chainify(blobs for name, tags, blobs in ddfs.findtags(input))
+        blobs = chainify(blobs for name, tags, blobs in ddfs.findtags(input))
+        if tagcache is not None:
+            tagcache[input] = blobs
+        return blobs
     return [input]
 
 def inputlist(inputs, **kwargs):
+    kwargs.setdefault('tagcache', {})
     return filter(None, chainify(inputexpand(input, **kwargs) for input in inputs))
 
 def save_oob(host, name, key, value, ddfs_token=None):
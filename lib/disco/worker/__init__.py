@@ -57,7 +57,28 @@ using a standard :class:`Worker`:
 import os, sys, time, traceback
 
 from disco.error import DataError
-from disco.fileutils import DiscoOutput, NonBlockingInput, Wait
+from disco.fileutils import DiscoOutput, DiscoZipFile, NonBlockingInput, Wait
+
+libzips = {}
+missing = object()
+
+def libzip():
+    """
+    :return: the zipped :mod:`clx` and :mod:`disco` libraries (serialized).
+
+    The libraries are only zipped the first time,
+    the same contents are reused for every subsequent :term:`job home`.
+    """
+    from clx import __file__ as clxpath
+    from disco import __file__ as discopath
+    paths = os.path.dirname(clxpath), os.path.dirname(discopath)
+    if paths not in libzips:
+        libs = DiscoZipFile()
+        for path in paths:
+            libs.writepath(path, exclude=('.pyc',))
+        libs.close()
+        libzips[paths] = libs.dumps()
+    return libzips[paths]
 
 class MessageWriter(object):
     def __init__(self, worker):
@@ -133,8 +154,12 @@ class Worker(dict):
         """
         if key in jobargs:
             return jobargs[key]
-        elif hasattr(job, key):
-            return getattr(job, key)
+        try:
+            attr = getattr(job, key, missing)
+        except Exception:
+            attr = missing
+        if attr is not missing:
+            return attr
         return self.get(key, default)
 
     def jobdict(self, job, **jobargs):
@@ -173,7 +198,7 @@ class Worker(dict):
 
         :return: the :term:`job dict`.
         """
-        from disco.util import inputlist, ispartitioned, read_index
+        from disco.util import inputlist, ispartitioned, read_index_ids
         def get(key, default=None):
             return self.getitem(key, job, jobargs, default)
         has_map = bool(get('map'))
@@ -190,9 +215,9 @@ class Worker(dict):
             nr_reduces = get('partitions') or 1
         elif ispartitioned(input):
             # no map, with partitions: len(dir://) specifies nr_reduces
-            nr_reduces = 1 + max(int(id)
+            nr_reduces = 1 + max(id
                                  for dir in input
-                                 for id, url in read_index(dir))
+                                 for id in read_index_ids(dir))
         else:
             # no map, without partitions can only have 1 reduce
             nr_reduces = 1
@@ -228,15 +253,11 @@ class Worker(dict):
     def jobzip(self, job, **jobargs):
         """
         A hook provided by the :class:`Worker` for creating the :term:`job home` zip.
+        The zip starts out with the contents of :func:`libzip`.
 
         :return: a :class:`disco.fileutils.DiscoZipFile`.
         """
-        from clx import __file__ as clxpath
-        from disco import __file__ as discopath
-        from disco.fileutils import DiscoZipFile
-        jobzip = DiscoZipFile()
-        jobzip.writepath(os.path.dirname(clxpath), exclude=('.pyc',))
-        jobzip.writepath(os.path.dirname(discopath), exclude=('.pyc',))
+        jobzip = DiscoZipFile(libzip())
         jobzip.writesource(job)
         jobzip.writesource(self)
         return jobzip
@@ -389,6 +410,8 @@ class Worker(dict):
             self.send('OUTPUT', [output.path, output.type, output.partition])
 
 class IDedInput(tuple):
+    __slots__ = ()
+
     @property
     def worker(self):
         return self[0]
@@ -148,7 +148,7 @@ def recurse_module(module, path):
     return dict((name, os.path.realpath(module.__file__)) for name, module in finder.modules.iteritems()
                 if name != '__main__' and module.__file__)
 
-def locate_modules(modules, recurse=True, include_sys=False):
+def locate_modules(modules, recurse=True, include_sys=False, recursed=None):
     """
     Finds module files corresponding to the module names specified in the list *modules*.
 
@@ -157,6 +157,9 @@ def locate_modules(modules, recurse=True, include_sys=False):
     :param recurse: If ``True``, recursively search for local modules
                     that are used in *modules*.
 
+    :param recursed: An optional dict of module paths which have already
+                     been searched recursively, shared between calls.
+
     A module is local if it can be found in your ``PYTHONPATH``. For modules that
     can be found under system-wide default paths (e.g. ``/usr/lib/python``), just
     the module name is returned without the corresponding path, so system-wide
@@ -175,7 +178,11 @@ def locate_modules(modules, recurse=True, include_sys=False):
         if dirname(path) in LOCALDIRS and os.path.isfile(path):
             found[module] = path
             if recurse:
-                found.update(recurse_module(module, path))
+                if recursed is None:
+                    recursed = {}
+                if path not in recursed:
+                    recursed[path] = recurse_module(module, path)
+                found.update(recursed[path])
         elif include_sys:
             found[module] = None
     return found.items()
@@ -201,15 +208,21 @@ def find_modules(functions, send_modules=True, recurse=True, exclude=()):
                     If ``False``, only modules that are directly used by
                     *functions* are included.
     """
-    modules = set()
+    modules, recursed = set(), {}
     for function in functions:
-        fmod = set([m for m in parse_function(function) if m not in exclude])
-        if send_modules:
-            try:
-                m = locate_modules(fmod, recurse, include_sys=True)
-            except ImportError, e:
-                raise ModUtilImportError(e, function)
-            modules.update((k, v) if v else k for k, v in m)
-        else:
-            modules.update(fmod)
+        modules.update(function_modules(function,
+                                        send_modules,
+                                        recurse,
+                                        exclude,
+                                        recursed=recursed))
     return list(modules)
+
+def function_modules(function, send_modules=True, recurse=True, exclude=(), recursed=None):
+    fmod = set(m for m in parse_function(function) if m not in exclude)
+    if send_modules:
+        try:
+            m = locate_modules(fmod, recurse, include_sys=True, recursed=recursed)
+        except ImportError, e:
+            raise ModUtilImportError(e, function)
+        return set((k, v) if v else k for k, v in m)
+    return fmod
@@ -0,0 +1,25 @@
+import os
+from cStringIO import StringIO
+from zipfile import ZipFile
+
+from clx import __file__ as clxpath
+from disco import __file__ as discopath
+from disco.fileutils import DiscoZipFile
+from disco.test import TestCase
+from disco.worker import libzip
+
+def libpath(lib, name):
+    return os.path.join(os.path.dirname(lib), name).lstrip('/')
+
+class JobHomeTestCase(TestCase):
+    def test_libzip(self):
+        jobzip = DiscoZipFile(libzip())
+        jobzip.writestr('extra/file', 'contents')
+        jobzip.close()
+        jobhome = ZipFile(StringIO(jobzip.dumps()))
+        names = jobhome.namelist()
+        self.assertEquals(jobhome.testzip(), None)
+        self.assertTrue(libpath(clxpath, 'settings.py') in names)
+        self.assertTrue(libpath(discopath, 'util.py') in names)
+        self.assertTrue(libpath(discopath, 'job.py') in names)
+        self.assertEquals(jobhome.read('extra/file'), 'contents')
@@ -1,7 +1,7 @@
 from disco.test import TestCase, TestJob
 from disco.worker.classic.modutil import find_modules, ModUtilImportError
 
-import sys, os
+import sys, os, shutil, tempfile
 
 support = os.path.join(os.path.dirname(__file__), 'support')
 mod1req = ('mod1', os.path.normpath(os.path.join(support, 'mod1.py')))
@@ -21,6 +21,13 @@ def missing_module():
 def recursive_module():
     mod1.plusceil(1, 2)
 
+def shared_module():
+    mod1.plusceil(2, 3)
+    os.path.abspath('')
+
+def edited_module():
+    moda.f()
+
 class ModUtilJob(TestJob):
     @staticmethod
     def map(e, params):
@@ -69,6 +76,35 @@ class ModUtilTestCase(TestCase):
     def test_recursive(self):
         self.assertFindsModules([recursive_module], [mod1req, mod2req], send_modules=True)
 
+    def test_shared(self):
+        union = set(find_modules([recursive_module])) | set(find_modules([shared_module]))
+        self.assertFindsModules([recursive_module, shared_module],
+                                union,
+                                send_modules=True)
+        self.assertFindsModules([recursive_module, shared_module],
+                                [mod1req, mod2req, 'os'],
+                                send_modules=True)
+
+    def test_edited(self):
+        tmpdir = tempfile.mkdtemp()
+        python_path = os.environ['PYTHONPATH']
+        try:
+            sys.path.append(tmpdir)
+            os.environ['PYTHONPATH'] = ':'.join((python_path, tmpdir))
+            moda = os.path.join(tmpdir, 'moda.py')
+            modb = os.path.join(tmpdir, 'modb.py')
+            open(modb, 'w').write('x = 1\n')
+            open(moda, 'w').write('def f():\n    pass\n')
+            self.assertFindsModules([edited_module], [('moda', moda)], send_modules=True)
+            open(moda, 'w').write('import modb\ndef f():\n    pass\n')
+            self.assertFindsModules([edited_module],
+                                    [('moda', moda), ('modb', modb)],
+                                    send_modules=True)
+        finally:
+            sys.path.remove(tmpdir)
+            os.environ['PYTHONPATH'] = python_path
+            shutil.rmtree(tmpdir)
+
     def test_norecursive(self):
         self.assertFindsModules([recursive_module], ['mod1'], recurse=False)
 
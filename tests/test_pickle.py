@@ -22,6 +22,19 @@ class PickleTestCase(TestCase):
         self.assertEquals(f().func_code, loads(dumps(f())).func_code)
         self.assertEquals(p('a', b='b'), loads(dumps(p))('a', b='b'))
 
+    def test_shared(self):
+        q = functools.partial(h, f, extra=f)
+        f_, q_ = loads(dumps((f, q)))
+        self.assertTrue(q_.args[0] is f_)
+        self.assertTrue(q_.keywords['extra'] is f_)
+
+    def test_shared_code(self):
+        g1, g2 = f(), f()
+        self.assertTrue(len(dumps((g1, g2))) < 1.5 * len(dumps(g1)))
+        g1_, g2_ = loads(dumps((g1, g2)))
+        self.assertEquals(g1_.func_code, g2_.func_code)
+        self.assertFalse(g1_ is g2_)
+
     def test_pattern(self):
         pattern = re.compile(r'pattern.*!')
         self.assertEquals(pattern, loads(dumps(pattern)))
@@ -2,7 +2,8 @@ import os
 from datetime import datetime
 
 from disco.test import TestCase
-from disco.util import flatten, iterify, urlsplit
+from disco.ddfs import DDFS
+from disco.util import chainify, flatten, inputlist, iterify, urlsplit
 
 def function(x):
     return x + 0
@@ -10,6 +11,29 @@ def function(x):
 sequence = 0, [1, [2, 3], [[4, [5, [6]]]]]
 
 class UtilTestCase(TestCase):
+    def test_chainify(self):
+        self.assertEquals([1, 2, 3, 4], chainify([[1], (2, 3), iter([4])]))
+        self.assertEquals([0, 1, 0, 1], chainify(xrange(2) for x in xrange(2)))
+
+    def test_inputlist_tags(self):
+        tags = {'tag://a': [['a1', 'a1r'], ['a2']], 'tag://b': [['b1']]}
+        calls = []
+        def findtags(ddfs, tag, **kwargs):
+            calls.append(tag)
+            yield tag, [], tags[tag]
+        inputs = ['tag://a', 'raw://x', ['tag://a', 'tag://b'], 'tag://a']
+        original = DDFS.findtags
+        DDFS.findtags = findtags
+        try:
+            result = inputlist(inputs)
+        finally:
+            DDFS.findtags = original
+        self.assertEquals(sorted(calls), ['tag://a', 'tag://b'])
+        self.assertEquals(result, [['a1', 'a1r'], ['a2'],
+                                   'raw://x',
+                                   [['a1', 'a1r'], ['a2'], ['b1']],
+                                   ['a1', 'a1r'], ['a2']])
+
     def test_flatten(self):
         self.assertEquals(range(7), list(flatten(sequence)))
 